@@ -149,7 +149,7 @@ def write_creation_files(
     proficiencies = {
         "skills": list({*background_data.get("skill_proficiencies", [])}),
         "tools": list({*background_data.get("tool_proficiencies", [])}),
-        "languages": race_data.get("languages", []),
+        "languages": list(race_data.get("languages", [])),
     }
 
     features = []
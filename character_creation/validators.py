@@ -1,4 +1,6 @@
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -13,12 +15,22 @@ except ImportError:  # pragma: no cover
     jsonschema = _Dummy()
 
 
-def _load_table(path: Path):
-    return json.load(open(path, "r", encoding="utf-8"))
+# Bounded: every edit to a table adds a new (path, mtime) key in the long-running service.
+@lru_cache(maxsize=128)
+def _load_json(path_str: str, mtime: float):
+    return json.loads(Path(path_str).read_bytes())
+
+
+def load_table(path: Path):
+    """Return the parsed JSON at ``path``, re-reading only when its mtime changes.
+
+    The result is shared between callers and must not be mutated.
+    """
+    return _load_json(str(path), os.path.getmtime(path))
 
 
 def validate_race(name: str, base_path: Path) -> Dict[str, object]:
-    races = _load_table(base_path / "character_creation" / "tables" / "races.json")
+    races = load_table(base_path / "character_creation" / "tables" / "races.json")
     for race in races:
         if race.get("name") == name:
             required = ["name", "ability_modifiers", "size", "speed", "languages"]
@@ -30,7 +42,7 @@ def validate_race(name: str, base_path: Path) -> Dict[str, object]:
 
 
 def validate_class(name: str, base_path: Path) -> Dict[str, object]:
-    classes = _load_table(base_path / "character_creation" / "tables" / "classes.json")
+    classes = load_table(base_path / "character_creation" / "tables" / "classes.json")
     for cls in classes:
         if cls.get("name") == name:
             required = ["name", "hit_die", "primary_ability", "saving_throws", "features"]
@@ -42,7 +54,7 @@ def validate_class(name: str, base_path: Path) -> Dict[str, object]:
 
 
 def validate_background(name: str, base_path: Path) -> Dict[str, object]:
-    backgrounds = _load_table(base_path / "character_creation" / "tables" / "backgrounds.json")
+    backgrounds = load_table(base_path / "character_creation" / "tables" / "backgrounds.json")
     for bg in backgrounds:
         if bg.get("name") == name:
             required = ["name", "skill_proficiencies", "tool_proficiencies", "feature", "equipment"]
@@ -54,7 +66,7 @@ def validate_background(name: str, base_path: Path) -> Dict[str, object]:
 
 
 def validate_inventory(class_name: str, background_name: str, base_path: Path) -> List[str]:
-    inventories = _load_table(base_path / "character_creation" / "tables" / "inventories.json")
+    inventories = load_table(base_path / "character_creation" / "tables" / "inventories.json")
     class_kits = inventories.get("class_kits", [])
     background_kits = inventories.get("background_kits", [])
     class_items = []
@@ -88,7 +100,7 @@ def validate_abilities(abilities: Dict[str, int]):
 
 
 def validate_final_character(character: Dict[str, object], base_path: Path):
-    schema = json.load(open(base_path / "schemas" / "character.schema.json", "r", encoding="utf-8"))
+    schema = load_table(base_path / "schemas" / "character.schema.json")
     jsonschema.validate(character, schema)
     return character
 
@@ -4,11 +4,12 @@
 Usage:
   python dice/verify_dice.py --check
   python dice/verify_dice.py --extend N
-  python dice/verify_dice.py --audit sessions/<slug>/changelog.md
+  python dice/verify_dice.py --audit sessions/<slug>/changelog.md [more changelogs ...]
 """
 import argparse
 import json
 import random
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -63,8 +64,9 @@ def extend_entropy(path: Path, count: int):
     print(f"Appended {count} lines; new total {last_i + count}")
 
 
-def audit_changelog(changelog: Path):
-    _, max_i = None, validate_entropy(ENTROPY_PATH)
+def audit_changelog(changelog: Path, max_i=None):
+    if max_i is None:
+        max_i = validate_entropy(ENTROPY_PATH)
     used = set()
     with changelog.open() as f:
         for line_no, line in enumerate(f, 1):
@@ -78,20 +80,20 @@ def audit_changelog(changelog: Path):
             for roll in entry.get("rolls", []):
                 idx = roll.get("entropy_index")
                 if idx is None:
-                    raise SystemExit(f"Missing entropy_index at changelog line {line_no}")
+                    raise SystemExit(f"Changelog {changelog} line {line_no} missing entropy_index")
                 if idx in used:
-                    raise SystemExit(f"Entropy index {idx} reused (line {line_no})")
+                    raise SystemExit(f"Changelog {changelog} line {line_no}: entropy index {idx} reused")
                 if not isinstance(idx, int) or idx < 1 or idx > max_i:
-                    raise SystemExit(f"Entropy index {idx} out of range (line {line_no})")
+                    raise SystemExit(f"Changelog {changelog} line {line_no}: entropy index {idx} out of range")
                 used.add(idx)
-    print(f"Audit passed: {len(used)} unique entropy indices referenced")
+    print(f"Audit passed for {changelog}: {len(used)} unique entropy indices referenced")
 
 
 def main():
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--check", action="store_true", help="validate entropy file")
     parser.add_argument("--extend", type=int, help="append N new lines deterministically")
-    parser.add_argument("--audit", type=str, help="audit changelog for entropy usage")
+    parser.add_argument("--audit", nargs="+", help="audit one or more changelogs for entropy usage")
     args = parser.parse_args()
 
     if not any([args.check, args.extend, args.audit]):
@@ -103,7 +105,20 @@ def main():
     if args.extend:
         extend_entropy(ENTROPY_PATH, args.extend)
     if args.audit:
-        audit_changelog(Path(args.audit))
+        # Validate the entropy file once, then audit each changelog independently.
+        max_i = validate_entropy(ENTROPY_PATH)
+        failed = False
+        for changelog in args.audit:
+            try:
+                audit_changelog(Path(changelog), max_i)
+            except SystemExit as exc:
+                print(exc, file=sys.stderr)
+                failed = True
+            except OSError as exc:
+                print(f"Changelog {changelog} could not be read: {exc}", file=sys.stderr)
+                failed = True
+        if failed:
+            raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -83,8 +83,7 @@ _FALLBACK_SPELLS = [
 def load_spells(spells_path: Path) -> List[Dict]:
     if not spells_path.exists():
         return list(_FALLBACK_SPELLS)
-    with spells_path.open(encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = json.loads(spells_path.read_bytes())
     validated = []
     for entry in data:
         name = entry.get("name")
@@ -22,6 +22,11 @@ _SLUG_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 _PREVIEWS_DIRNAME = "previews"
 
 
+def is_valid_slug(slug: str) -> bool:
+    """Return True if slug is usable as a session directory name."""
+    return _SLUG_PATTERN.match(slug) is not None
+
+
 def _canonical_hash(data: Dict) -> str:
     """Compute a deterministic hash for a JSON-serializable object."""
     payload = json.dumps(data, sort_keys=True, separators=(",", ":"))
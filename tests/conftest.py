@@ -1,70 +1,98 @@
+import copy
+import itertools
 import json
+import os
+import sys
 from pathlib import Path
 
 import pytest
 
-
-def _write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-
-
-def _seed_entropy(path: Path, count: int = 10) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+TEMPLATE_SLUG = "example-rogue"
+TEMPLATE_STATE = {
+    "character": TEMPLATE_SLUG,
+    "turn": 0,
+    "scene_id": "init",
+    "location": "Test Location",
+    "hp": 10,
+    "conditions": [],
+    "flags": {},
+    "log_index": 0,
+    "level": 1,
+    "xp": 0,
+    "inventory": [],
+    "world": "default",
+}
+TEMPLATE_CHARACTER = {
+    "slug": TEMPLATE_SLUG,
+    "name": "Test Hero",
+    "race": "Human",
+    "class": "Rogue",
+    "background": "Urchin",
+    "level": 1,
+    "hp": 10,
+    "ac": 12,
+    "abilities": {"str": 10, "dex": 14, "con": 10, "int": 10, "wis": 10, "cha": 10},
+    "skills": {},
+    "inventory": [],
+    "starting_equipment": [],
+    "features": [],
+    "proficiencies": {"skills": [], "tools": [], "languages": []},
+    "notes": "",
+    "creation_source": "dm",
+}
+_SLUG_COUNTER = itertools.count(1)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", default=False, help="run tests marked as slow")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests that write into the repository checkout on one pytest-xdist worker",
+    )
+    config.addinivalue_line("markers", "slow: long-running integration test, only run with --run-slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def _entropy_lines(count: int = 10) -> str:
     lines = []
     for idx in range(1, count + 1):
         lines.append(json.dumps({"i": idx, "d20": [idx, idx + 1]}))
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return "\n".join(lines) + "\n"
+
+
+# Serialized once per run; every repo_root just writes these bytes into its tmp tree.
+_SEED_FILES = {
+    f"sessions/{TEMPLATE_SLUG}/state.json": json.dumps(TEMPLATE_STATE, indent=2).encode("utf-8"),
+    f"data/characters/{TEMPLATE_SLUG}.json": json.dumps(TEMPLATE_CHARACTER, indent=2).encode("utf-8"),
+    "dice/entropy.ndjson": _entropy_lines().encode("utf-8"),
+}
+
+
+def _write_seed(root: Path) -> None:
+    for rel, payload in _SEED_FILES.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
 
 
 @pytest.fixture(params=["file", "sqlite"])
 def repo_root(tmp_path, monkeypatch, request):
-    sessions_dir = tmp_path / "sessions"
-    data_dir = tmp_path / "data"
-    worlds_dir = tmp_path / "worlds"
-    dice_path = tmp_path / "dice" / "entropy.ndjson"
-
-    template_slug = "example-rogue"
-    template_dir = sessions_dir / template_slug
-    template_state = {
-        "character": template_slug,
-        "turn": 0,
-        "scene_id": "init",
-        "location": "Test Location",
-        "hp": 10,
-        "conditions": [],
-        "flags": {},
-        "log_index": 0,
-        "level": 1,
-        "xp": 0,
-        "inventory": [],
-        "world": "default",
-    }
-    _write_json(template_dir / "state.json", template_state)
-
-    template_character = {
-        "slug": template_slug,
-        "name": "Test Hero",
-        "race": "Human",
-        "class": "Rogue",
-        "background": "Urchin",
-        "level": 1,
-        "hp": 10,
-        "ac": 12,
-        "abilities": {"str": 10, "dex": 14, "con": 10, "int": 10, "wis": 10, "cha": 10},
-        "skills": {},
-        "inventory": [],
-        "starting_equipment": [],
-        "features": [],
-        "proficiencies": {"skills": [], "tools": [], "languages": []},
-        "notes": "",
-        "creation_source": "dm",
-    }
-    _write_json(data_dir / "characters" / f"{template_slug}.json", template_character)
-
-    worlds_dir.mkdir(parents=True, exist_ok=True)
-    (worlds_dir / "default").mkdir(parents=True, exist_ok=True)
-    _seed_entropy(dice_path)
+    _write_seed(tmp_path)
 
     backend_name = request.param
     db_path = tmp_path / "dm.sqlite"
@@ -75,6 +103,9 @@ def repo_root(tmp_path, monkeypatch, request):
     monkeypatch.setenv("DM_SERVICE_WORLDS_DIR", "worlds")
     monkeypatch.setenv("DM_SERVICE_DICE_FILE", "dice/entropy.ndjson")
     monkeypatch.delenv("DM_API_KEY", raising=False)
+    # Without an LLM key, narration short-circuits to its deterministic fallback
+    # instead of reaching out to a real provider from a developer's shell env.
+    monkeypatch.delenv("DM_SERVICE_LLM_API_KEY", raising=False)
     monkeypatch.setenv("STORAGE_BACKEND", backend_name)
     if backend_name == "sqlite":
         monkeypatch.setenv("DATABASE_URL", str(db_path))
@@ -87,8 +118,8 @@ def repo_root(tmp_path, monkeypatch, request):
     return tmp_path
 
 
-@pytest.fixture()
-def client(repo_root):
+@pytest.fixture(scope="session")
+def _shared_client():
     from fastapi.testclient import TestClient
     from service.app import app
 
@@ -96,9 +127,49 @@ def client(repo_root):
         yield test_client
 
 
+@pytest.fixture()
+def client(repo_root, _shared_client):
+    # Settings are resolved per request from the environment that repo_root just
+    # configured, so one TestClient serves every test; only client-side state
+    # needs resetting between tests.
+    _shared_client.cookies.clear()
+    yield _shared_client
+    _shared_client.cookies.clear()
+
+
 @pytest.fixture()
 def session_slug(client):
-    payload = {"slug": "test-session", "template_slug": "example-rogue"}
-    response = client.post("/api/sessions", json=payload)
+    slug = f"t-{os.getenv('PYTEST_XDIST_WORKER', 'gw0')}-{next(_SLUG_COUNTER)}"
+    response = client.post("/api/sessions", json={"slug": slug, "template_slug": TEMPLATE_SLUG})
     assert response.status_code == 201
-    return response.json()["slug"]
+    assert response.json()["slug"] == slug
+    return slug
+
+
+class SessionEndpoints:
+    """Thin wrapper that prefixes requests with a session's API path."""
+
+    def __init__(self, client, slug: str):
+        self.client = client
+        self.slug = slug
+        self.prefix = f"/api/sessions/{slug}"
+        self.events_url = f"/api/events/{slug}"
+
+    def get(self, sub: str, **kwargs):
+        return self.client.get(self.prefix + sub, **kwargs)
+
+    def post(self, sub: str, **kwargs):
+        return self.client.post(self.prefix + sub, **kwargs)
+
+
+@pytest.fixture()
+def session_api(client, session_slug):
+    return SessionEndpoints(client, session_slug)
+
+
+@pytest.fixture()
+def base_state(session_slug):
+    # New sessions are cloned from the template, so their opening state is known
+    # without a round trip; only post-mutation state needs a live GET. Tests get
+    # their own copy so a mutation cannot leak into the shared template.
+    return copy.deepcopy(TEMPLATE_STATE)
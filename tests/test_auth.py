@@ -1,13 +1,11 @@
 import pytest
-from fastapi.testclient import TestClient
 
 
 @pytest.fixture()
-def client_with_api_key(repo_root, monkeypatch):
+def client_with_api_key(client, monkeypatch):
+    # The API key guard reads DM_API_KEY per request, so the shared client works as-is.
     monkeypatch.setenv("DM_API_KEY", "secret")
-    from service.app import app
-    with TestClient(app) as test_client:
-        yield test_client
+    return client
 
 
 def test_post_allowed_without_key_when_disabled(client):
@@ -1,10 +1,9 @@
 import json
+import os
 import shutil
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 try:
     import jsonschema
 except ImportError:  # pragma: no cover
@@ -28,12 +27,25 @@ EXPECTED_ABILITIES = {
 }
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _link_tree(src: Path, dst: Path) -> None:
+    # The builder only writes under data/ and sessions/, so the seeded trees can
+    # share inodes with the checkout instead of duplicating their bytes.
+    shutil.copytree(src, dst, copy_function=_link_or_copy, dirs_exist_ok=True)
+
+
 def _prepare_base(tmp_path: Path) -> Path:
     base = tmp_path / "game"
     base.mkdir()
-    shutil.copytree(Path("schemas"), base / "schemas")
-    shutil.copytree(Path("character_creation"), base / "character_creation")
-    shutil.copytree(Path("dice"), base / "dice")
+    seed_dirs = ("schemas", "character_creation", "dice")
+    with ThreadPoolExecutor(max_workers=len(seed_dirs)) as pool:
+        list(pool.map(lambda name: _link_tree(Path(name), base / name), seed_dirs))
     (base / "data" / "characters").mkdir(parents=True, exist_ok=True)
     (base / "sessions").mkdir(parents=True, exist_ok=True)
     return base
@@ -1,5 +1,7 @@
-def test_character_state_patch_syncs_roll_and_ui(client, session_slug):
-    preview_request = {
+import json
+
+_PREVIEW_BODY = json.dumps(
+    {
         "response": "I take the loot and catch my breath.",
         "state_patch": {
             "hp": 7,
@@ -14,20 +16,26 @@ def test_character_state_patch_syncs_roll_and_ui(client, session_slug):
         "transcript_entry": "Player takes loot and rests.",
         "dice_expressions": [],
     }
-    preview_response = client.post(
-        f"/api/sessions/{session_slug}/turn/preview",
-        json=preview_request,
+).encode("utf-8")
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def test_character_state_patch_syncs_roll_and_ui(session_api):
+    preview_response = session_api.post(
+        "/turn/preview",
+        content=_PREVIEW_BODY,
+        headers=_JSON_HEADERS,
     )
     assert preview_response.status_code == 200
     preview_id = preview_response.json()["id"]
 
-    commit_response = client.post(
-        f"/api/sessions/{session_slug}/turn/commit",
+    commit_response = session_api.post(
+        "/turn/commit",
         json={"preview_id": preview_id},
     )
     assert commit_response.status_code == 200
 
-    bundle_response = client.get(f"/api/sessions/{session_slug}/player")
+    bundle_response = session_api.get("/player")
     assert bundle_response.status_code == 200
     bundle = bundle_response.json()
 
@@ -51,7 +59,7 @@ def test_character_state_patch_syncs_roll_and_ui(client, session_slug):
     assert character["ac"] == 14
 
     roll_request = {"kind": "ability_check", "ability": "STR"}
-    roll_response = client.post(f"/api/sessions/{session_slug}/roll", json=roll_request)
+    roll_response = session_api.post("/roll", json=roll_request)
     assert roll_response.status_code == 200
     roll_payload = roll_response.json()
     assert roll_payload["total"] == 5
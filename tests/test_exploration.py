@@ -1,10 +1,9 @@
 import json
-import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import pytest
 
-from tools.explore import roll_on_table, advance_time
+from tools.explore import _load_table, advance_time, choose_next_hex, find_hex, roll_on_table, write_json
 
 
 def test_advance_time_modifiers():
@@ -17,3 +16,33 @@ def test_rolls_valid_entries():
     result, idx, roll_val = roll_on_table(Path('tables/weather/temperate.json'), state)
     assert result['condition']
     assert idx == 1
+
+
+def test_table_load_is_cached():
+    table_path = Path('tables/weather/temperate.json')
+    roll_on_table(table_path, {"log_index": 0})
+    hits_before = _load_table.cache_info().hits
+    result, idx, roll_val = roll_on_table(table_path, {"log_index": 1})
+    assert _load_table.cache_info().hits == hits_before + 1
+    assert idx == 2
+
+
+def test_find_hex_and_next_hex():
+    hexmap = {
+        "hexes": [
+            {"q": 0, "r": 0, "biome": "forest", "neighbors": [{"q": 1, "r": 0}]},
+            {"q": 1, "r": 0, "biome": "hills", "neighbors": []},
+        ]
+    }
+    start = find_hex(hexmap, 0, 0)
+    assert choose_next_hex(hexmap, start)["biome"] == "hills"
+    with pytest.raises(KeyError):
+        find_hex(hexmap, 5, 5)
+
+
+def test_write_json_replaces_target(tmp_path):
+    target = tmp_path / "state.json"
+    target.write_text("{}", encoding="utf-8")
+    write_json(target, {"gp": 5})
+    assert json.loads(target.read_text(encoding="utf-8")) == {"gp": 5}
+    assert not (tmp_path / "state.json.tmp").exists()
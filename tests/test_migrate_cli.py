@@ -1,23 +1,22 @@
 import json
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from service.config import Settings
 from service.storage_backends.sqlite_backend import SQLiteDatabase, SQLiteStateStore, SQLiteTextLogStore, SQLiteTurnStore
 from tools import migrate_to_sqlite as migrator
 
 
 def _write(path: Path, payload) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if not path.parent.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
 
 
 def test_migrate_cli_round_trip(tmp_path):
     source = tmp_path / "src"
     session_dir = source / "sessions" / "demo-session"
-    session_dir.mkdir(parents=True)
+    for directory in (session_dir / "turns", session_dir / "saves", source / "data" / "characters"):
+        directory.mkdir(parents=True)
 
     state = {
         "character": "demo-session",
@@ -66,3 +65,14 @@ def test_migrate_cli_round_trip(tmp_path):
 
     turn_records = SQLiteTurnStore(db).load_turn_records(settings, "demo-session", limit=5)
     assert len(turn_records) == 2
+
+
+def test_migrate_cli_reports_invalid_state(tmp_path, capsys):
+    source = tmp_path / "src"
+    session_dir = source / "sessions" / "broken"
+    session_dir.mkdir(parents=True)
+    _write(session_dir / "state.json", {"turn": "not-a-number"})
+
+    rc = migrator.main(["--source", str(source), "--db", str(tmp_path / "dm.sqlite")])
+    assert rc == 2
+    assert "[FAIL] broken: state invalid" in capsys.readouterr().out
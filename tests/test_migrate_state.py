@@ -0,0 +1,65 @@
+import io
+import json
+import sys
+
+import pytest
+
+from tools import migrate_state
+
+STATE = {
+    "character": "demo",
+    "turn": 0,
+    "scene_id": "init",
+    "location": "Start",
+    "hp": 10,
+    "conditions": [],
+    "flags": {},
+    "log_index": 0,
+    "level": 1,
+    "xp": 0,
+    "inventory": [],
+    "world": "default",
+}
+
+
+@pytest.fixture()
+def state_path(tmp_path, monkeypatch):
+    path = tmp_path / "sessions" / "demo" / "state.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps(STATE, indent=2) + "\n")
+    monkeypatch.setattr(migrate_state, "REPO_ROOT", tmp_path)
+    return path
+
+
+def _run_batch(monkeypatch, stdin):
+    monkeypatch.setattr(sys, "argv", ["migrate_state.py", "demo", "--batch"])
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    migrate_state.main()
+
+
+def test_batch_applies_patches_in_order(state_path, monkeypatch):
+    _run_batch(monkeypatch, '{"hp": 7, "turn": 1}\n\n{"hp": 5}\n{"location": "Gate"}\n')
+    state = json.loads(state_path.read_text())
+    assert (state["hp"], state["turn"], state["location"]) == (5, 1, "Gate")
+
+
+def test_batch_invalid_patch_leaves_state_untouched(state_path, monkeypatch):
+    before = state_path.read_bytes()
+    with pytest.raises(SystemExit, match="Schema validation failed"):
+        _run_batch(monkeypatch, '{"hp": 7}\n{"hp": "lots"}\n{"hp": 5}\n')
+    assert state_path.read_bytes() == before
+
+
+def test_batch_reports_bad_json_line(state_path, monkeypatch):
+    before = state_path.read_bytes()
+    with pytest.raises(SystemExit, match="line 2"):
+        _run_batch(monkeypatch, '{"hp": 7}\n{"hp": \n')
+    assert state_path.read_bytes() == before
+
+
+@pytest.mark.parametrize("stdin", ["", " \n\n"])
+def test_batch_rejects_empty_input(state_path, monkeypatch, stdin):
+    before = state_path.read_bytes()
+    with pytest.raises(SystemExit, match="No JSON patches"):
+        _run_batch(monkeypatch, stdin)
+    assert state_path.read_bytes() == before
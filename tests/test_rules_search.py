@@ -1,11 +1,27 @@
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+REPO_ROOT = Path(__file__).resolve().parents[1]
 
 
 def test_rules_index_and_search(tmp_path):
-    subprocess.run(["python", "tools/index_rules.py"], check=True)
-    result = subprocess.run(["python", "tools/search_rules.py", "movement"], capture_output=True, text=True, check=True)
+    # Index a copy of the rules inside tmp_path so parallel workers never share rules_index/.
+    shutil.copytree(REPO_ROOT / "data" / "rules", tmp_path / "data" / "rules")
+    subprocess.run([sys.executable, str(REPO_ROOT / "tools" / "index_rules.py")], cwd=tmp_path, check=True)
+    result = subprocess.run(
+        [sys.executable, str(REPO_ROOT / "tools" / "search_rules.py"), "movement"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
     assert "movement.md" in result.stdout
+
+
+def test_search_uses_index_tokenizer():
+    from tools import index_rules, search_rules
+
+    assert search_rules.tokenize is index_rules.tokenize
+    assert index_rules.tokenize("Speed (excerpt): Dwarves' 25 ft.") == ["speed", "excerpt", "dwarves'", "25", "ft"]
@@ -1,3 +1,8 @@
+from itertools import islice
+
+import pytest
+
+
 def test_health(client):
     response = client.get("/api/health")
     assert response.status_code == 200
@@ -5,8 +10,8 @@ def test_health(client):
     assert "status" in payload
 
 
-def test_session_create_and_state(client, session_slug):
-    response = client.get(f"/api/sessions/{session_slug}/state")
+def test_session_create_and_state(session_api):
+    response = session_api.get("/state")
     assert response.status_code == 200
     payload = response.json()
     assert "turn" in payload
@@ -18,40 +23,38 @@ def test_session_create_and_state(client, session_slug):
     assert payload["log_index"] == 0
 
 
-def test_player_bundle_shape(client, session_slug):
-    response = client.get(f"/api/sessions/{session_slug}/player")
+def test_player_bundle_shape(session_api):
+    response = session_api.get("/player")
     assert response.status_code == 200
     payload = response.json()
     for key in ("state", "character", "recaps", "discoveries", "quests", "suggestions"):
         assert key in payload
 
 
-def test_events_stream_initial_update(client, session_slug):
-    with client.stream(
+# The SSE stream only closes after its ~60s idle timeout, so each run pays that wait.
+@pytest.mark.slow
+def test_events_stream_initial_update(session_api):
+    with session_api.client.stream(
         "GET",
-        f"/api/events/{session_slug}",
+        session_api.events_url,
         params={"transcript_cursor": -1, "changelog_cursor": -1},
     ) as stream:
-        data_line = None
-        for line in stream.iter_lines():
-            if not line:
-                continue
-            text = line.decode() if isinstance(line, (bytes, bytearray)) else str(line)
-            if text.startswith("data:"):
-                data_line = text
-                break
+        lines = (
+            line.decode() if isinstance(line, (bytes, bytearray)) else str(line)
+            for line in islice(stream.iter_lines(), 64)
+        )
+        data_line = next((text for text in lines if text.startswith("data:")), None)
         assert data_line is not None
-        assert data_line.startswith("data:")
 
 
-def test_rest_endpoints_reset_hp_and_slots(client, session_slug):
+def test_rest_endpoints_reset_hp_and_slots(session_api):
     # claim lock
-    lock_resp = client.post(f"/api/sessions/{session_slug}/lock/claim", json={"owner": "tester", "ttl": 300})
+    lock_resp = session_api.post("/lock/claim", json={"owner": "tester", "ttl": 300})
     assert lock_resp.status_code == 200
 
     # set low hp and empty slots via preview/commit
-    preview = client.post(
-        f"/api/sessions/{session_slug}/turn/preview",
+    preview = session_api.post(
+        "/turn/preview",
         json={
             "response": "testing rest",
             "state_patch": {"hp": 1, "max_hp": 10, "spell_slots": {"1": 0}},
@@ -62,10 +65,10 @@ def test_rest_endpoints_reset_hp_and_slots(client, session_slug):
     )
     assert preview.status_code == 200
     preview_id = preview.json()["id"]
-    commit = client.post(f"/api/sessions/{session_slug}/turn/commit", json={"preview_id": preview_id, "lock_owner": "tester"})
+    commit = session_api.post("/turn/commit", json={"preview_id": preview_id, "lock_owner": "tester"})
     assert commit.status_code == 200
 
-    rest_resp = client.post(f"/api/sessions/{session_slug}/rest/long", json={"lock_owner": "tester"})
+    rest_resp = session_api.post("/rest/long", json={"lock_owner": "tester"})
     assert rest_resp.status_code == 200
     state = rest_resp.json()["state"]
     assert state["hp"] == 10
@@ -2,8 +2,11 @@ from pathlib import Path
 
 import pytest
 
+# Writes ui/dist/index.html inside the checkout, so it must not race other workers.
+pytestmark = pytest.mark.xdist_group("repo_checkout")
 
-@pytest.fixture()
+
+@pytest.fixture(scope="session")
 def spa_index_html():
     repo_root = Path(__file__).resolve().parents[1]
     dist_path = repo_root / "ui" / "dist"
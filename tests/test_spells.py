@@ -22,9 +22,9 @@ def test_reset_spell_slots_aliases_full():
 
 def test_spell_index_lookup(tmp_path):
     spells_path = tmp_path / "spells.json"
-    spells_path.write_text(
-        '[{"name":"Fire Bolt","level":0},{"name":"Cure Wounds","level":1}]',
-        encoding="utf-8",
+    spells_path.write_bytes(
+        b'[{"name":"Fire Bolt","level":0,"casting_time":"1 action"},'
+        b'{"name":"Cure Wounds","level":1,"casting_time":"1 action"}]'
     )
     index = spells.spell_index_by_name(spells_path)
     assert "Fire Bolt" in index
@@ -1,27 +1,42 @@
 import json
-import sys
+import os
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 try:
     import jsonschema
 except ImportError:  # pragma: no cover
     class _Dummy:
-        @staticmethod
-        def validate(instance, schema):
-            return True
+        class Draft7Validator:
+            def __init__(self, schema):
+                self.schema = schema
+
+            def validate(self, instance):
+                return True
 
     jsonschema = _Dummy()
 
 from tools.explore import roll_on_table
 
 
+def _iter_json(root):
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.json'):
+                    yield entry.path
+
+
 def test_tables_schema():
-    schema = json.load(open(Path('schemas/table.schema.json'), 'r', encoding='utf-8'))
-    for path in Path('tables').rglob('*.json'):
-        data = json.load(open(path, 'r', encoding='utf-8'))
-        jsonschema.validate(data, schema)
+    schema = json.loads(Path('schemas/table.schema.json').read_bytes())
+    validator = jsonschema.Draft7Validator(schema)
+    paths = list(_iter_json('tables'))
+    assert paths
+    for path in paths:
+        with open(path, 'rb') as handle:
+            validator.validate(json.loads(handle.read()))
 
 
 def test_deterministic_roll():
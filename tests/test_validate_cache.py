@@ -0,0 +1,30 @@
+import os
+
+from tools.validate import ValidationCache
+
+
+def test_validation_cache_skips_unchanged_files(tmp_path):
+    data_file = tmp_path / "table.json"
+    data_file.write_text('{"entries": []}', encoding="utf-8")
+    cache_path = tmp_path / ".validate_cache.json"
+    calls = []
+
+    def check(path, validator):
+        calls.append(path)
+
+    cache = ValidationCache.load(cache_path)
+    cache.run(check, data_file, object(), 1)
+    cache.save()
+    assert len(calls) == 1
+
+    cache = ValidationCache.load(cache_path)
+    cache.run(check, data_file, object(), 1)
+    assert len(calls) == 1
+
+    # A newer schema or a modified file invalidates the entry.
+    cache.run(check, data_file, object(), 2)
+    assert len(calls) == 2
+    stat = data_file.stat()
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    cache.run(check, data_file, object(), 1)
+    assert len(calls) == 3
@@ -46,7 +46,7 @@ def main():
     final_abilities = builder.apply_racial_modifiers(rolled, race_data)
     validators.validate_abilities(final_abilities)
 
-    inventories = json.load(open(base_path / "character_creation" / "tables" / "inventories.json", "r", encoding="utf-8"))
+    inventories = validators.load_table(base_path / "character_creation" / "tables" / "inventories.json")
     if args.start_inventory.lower() == "auto":
         inventory_items = builder.build_inventory(args.char_class, args.background, inventories)
     else:
@@ -57,7 +57,7 @@ def main():
         final_name = args.name
         name_roll = []
     else:
-        names = json.load(open(base_path / "character_creation" / "tables" / "names_human.json", "r", encoding="utf-8"))
+        names = validators.load_table(base_path / "character_creation" / "tables" / "names_human.json")
         final_name, name_roll_result = builder.auto_name(cursor, names)
         name_roll = [name_roll_result]
 
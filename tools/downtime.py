@@ -1,7 +1,7 @@
 import argparse
 import json
 from pathlib import Path
-from tools.explore import next_entropy, roll_from_entry
+from tools.explore import next_entropy, read_json, roll_from_entry, write_json
 
 OUTCOMES = {
     "train": "gains a skill edge",
@@ -21,7 +21,7 @@ def main():
     transcript_path = session_dir / "transcript.md"
     changelog_path = session_dir / "changelog.md"
 
-    state = json.load(open(state_path, "r", encoding="utf-8"))
+    state = read_json(state_path)
     entry = next_entropy(state.get("log_index", 0))
     roll_val = roll_from_entry("1d20", entry)
     state["log_index"] = entry["i"]
@@ -45,7 +45,7 @@ def main():
             + "\n"
         )
 
-    json.dump(state, open(state_path, "w", encoding="utf-8"), indent=2)
+    write_json(state_path, state)
 
 
 if __name__ == "__main__":
@@ -10,10 +10,16 @@ import json
 from pathlib import Path
 import sys
 
-# Add service directory to path
-sys.path.append(str(Path(__file__).resolve().parent.parent / "service"))
+SERVICE_DIR = str(Path(__file__).resolve().parent.parent / "service")
 
-from llm_narrative import LLMNarrativeEnhancer, get_narrative_enhancer
+
+def _get_enhancer():
+    """Import the LLM stack on first use so argument parsing stays cheap."""
+    if SERVICE_DIR not in sys.path:
+        sys.path.append(SERVICE_DIR)
+    from llm_narrative import get_narrative_enhancer
+
+    return get_narrative_enhancer()
 
 
 def load_scene_context(slug: str, scene_type: str) -> dict:
@@ -46,7 +52,7 @@ async def generate_scene_narrative(
     use_llm: bool = True
 ) -> dict:
     """Generate narrative for a scene"""
-    enhancer = get_narrative_enhancer()
+    enhancer = _get_enhancer()
     context = load_scene_context(slug, scene_type)
     
     result = {
@@ -103,7 +109,7 @@ async def generate_npc_dialogue(
     situation: str
 ) -> dict:
     """Generate dialogue for an NPC"""
-    enhancer = get_narrative_enhancer()
+    enhancer = _get_enhancer()
     context = load_scene_context(slug, "dialogue")
     
     result = {
@@ -142,7 +148,7 @@ async def generate_creature_description(
     encounter_context: str
 ) -> dict:
     """Generate vivid description for a creature"""
-    enhancer = get_narrative_enhancer()
+    enhancer = _get_enhancer()
     
     # Load creature data
     creature_full_path = Path(creature_path)
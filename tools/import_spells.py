@@ -11,13 +11,13 @@ Usage:
 
 import argparse
 import json
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List
 
 
 def _load_raw(path: Path) -> List[Dict[str, Any]]:
-    with path.open(encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = json.loads(path.read_bytes())
     if isinstance(data, dict):
         if "results" in data:
             return data["results"]
@@ -33,9 +33,9 @@ def _normalize_components(raw) -> List[str]:
     if isinstance(raw, list):
         return [str(x).strip() for x in raw if x]
     if isinstance(raw, str):
-        parts = [p.strip() for p in raw.replace(",", " ").split() if p.strip()]
-        # Keep only uppercase component tags (V,S,M) where possible
-        return [p.upper() for p in parts if len(p) <= 3]
+        # Keep only uppercase component tags (V,S,M) where possible; split()
+        # already drops empty and whitespace-only parts.
+        return [p.upper() for p in raw.replace(",", " ").split() if len(p) <= 3]
     return []
 
 
@@ -77,10 +77,12 @@ def main():
             continue
         normalized.append(norm)
 
-    normalized.sort(key=lambda x: (x["level"], x["name"]))
+    normalized.sort(key=itemgetter("level", "name"))
     out_path = Path(args.output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(normalized, indent=2), encoding="utf-8")
+    # Stream the encoder's chunks to disk rather than building one large string.
+    with out_path.open("w", encoding="utf-8") as handle:
+        json.dump(normalized, handle, indent=2)
     print(f"Wrote {len(normalized)} spells to {out_path}")
 
 
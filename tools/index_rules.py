@@ -1,31 +1,42 @@
 import json
+import re
 from collections import Counter
 from pathlib import Path
 
 
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
 def tokenize(text):
-    return [t.strip(".,;:!?").lower() for t in text.split() if t.strip()]
+    return _TOKEN_RE.findall(text.lower())
 
 
 def main():
     rules_dir = Path("data/rules")
-    docs = []
+    out_dir = Path("rules_index")
+    out_dir.mkdir(exist_ok=True)
     meta = []
     vocab = Counter()
-    for path in sorted(rules_dir.glob("*.md")):
-        text = path.read_text(encoding="utf-8")
-        tokens = tokenize(text)
-        docs.append({"file": str(path), "tokens": tokens})
-        vocab.update(tokens)
-        meta.append({"file": str(path), "lines": len(text.splitlines())})
+    postings = {}
+    # Each document's token list is written straight to docs.ndjson rather than
+    # collected into one list. vocab and postings still accumulate every
+    # document's token counts until they are written at the end.
+    with open(out_dir / "docs.ndjson", "w", encoding="utf-8") as docs_out:
+        for path in sorted(rules_dir.glob("*.md")):
+            text = path.read_text(encoding="utf-8")
+            tokens = tokenize(text)
+            docs_out.write(json.dumps({"file": str(path), "tokens": tokens}) + "\n")
+            vocab.update(tokens)
+            for token, tf in Counter(tokens).items():
+                postings.setdefault(token, []).append([len(meta), tf])
+            meta.append({"file": str(path), "lines": len(text.splitlines())})
 
-    out_dir = Path("rules_index")
-    out_dir.mkdir(exist_ok=True)
     json.dump(vocab, open(out_dir / "vocab.json", "w", encoding="utf-8"), indent=2)
     json.dump(meta, open(out_dir / "docmeta.json", "w", encoding="utf-8"), indent=2)
-    json.dump(docs, open(out_dir / "docs.json", "w", encoding="utf-8"), indent=2)
+    # token -> [[doc_id, term frequency], ...] so a query only touches matching documents.
+    (out_dir / "postings.json").write_text(json.dumps(postings, separators=(",", ":")), encoding="utf-8")
 
-    print("Indexed", len(docs), "documents")
+    print("Indexed", len(meta), "documents")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 import argparse
 import json
 from pathlib import Path
-from tools.explore import roll_on_table
+from tools.explore import read_json, roll_on_table, write_json
 
 
 def main():
@@ -16,7 +16,7 @@ def main():
     loot_dir = session_dir / "loot"
     loot_dir.mkdir(exist_ok=True)
 
-    state = json.load(open(state_path, "r", encoding="utf-8"))
+    state = read_json(state_path)
     loot_result, idx, roll_val = roll_on_table(Path("tables/treasure/hoard_tier1.json"), state)
     state["gp"] = state.get("gp", 0) + loot_result.get("gp", 0)
     inventory = state.get("flags", {}).get("inventory", [])
@@ -29,7 +29,7 @@ def main():
         "gp": loot_result.get("gp", 0),
     }
     loot_path = loot_dir / f"{loot_entry['id']}.json"
-    json.dump(loot_entry, open(loot_path, "w", encoding="utf-8"), indent=2)
+    write_json(loot_path, loot_entry)
 
     with open(transcript_path, "a", encoding="utf-8") as tlog:
         tlog.write(f"Loot gathered: +{loot_entry['gp']} gp, items={', '.join(loot_entry['items'])}.\n")
@@ -37,7 +37,7 @@ def main():
     with open(changelog_path, "a", encoding="utf-8") as clog:
         clog.write(json.dumps({"type": "loot", "rolls": [{"expression": "loot", "result": roll_val, "entropy_index": idx}]}) + "\n")
 
-    json.dump(state, open(state_path, "w", encoding="utf-8"), indent=2)
+    write_json(state_path, state)
 
 
 if __name__ == "__main__":
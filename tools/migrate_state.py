@@ -3,47 +3,81 @@
 
 Usage:
   python tools/migrate_state.py <slug> < patch.json
+  python tools/migrate_state.py <slug> --batch < patches.ndjson
+
+With --batch, stdin holds one JSON patch per line. Patches are applied in
+order, each result is validated, and the state is written once at the end;
+nothing is written if any patch fails.
 """
 import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SCHEMA_PATH = REPO_ROOT / "schemas" / "state.schema.json"
 
 
 def load_json(path: Path):
-    with path.open() as f:
-        return json.load(f)
+    return json.loads(path.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _state_validator():
+    schema = load_json(SCHEMA_PATH)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def _read_patches(batch):
+    if not batch:
+        try:
+            return [json.load(sys.stdin)]
+        except json.JSONDecodeError as exc:
+            sys.exit(f"Invalid JSON patch: {exc}")
+    patches = []
+    for lineno, line in enumerate(sys.stdin, start=1):
+        if not line.strip():
+            continue
+        try:
+            patches.append(json.loads(line))
+        except json.JSONDecodeError as exc:
+            sys.exit(f"Invalid JSON patch on line {lineno}: {exc}")
+    if not patches:
+        sys.exit("No JSON patches on stdin")
+    return patches
 
 
 def main():
-    if len(sys.argv) != 2:
+    args = sys.argv[1:]
+    batch = "--batch" in args
+    if batch:
+        args.remove("--batch")
+    if len(args) != 1:
         print(__doc__)
         sys.exit(1)
-    slug = sys.argv[1]
+    slug = args[0]
     state_path = REPO_ROOT / "sessions" / slug / "state.json"
     if not state_path.exists():
         sys.exit(f"Missing state file: {state_path}")
 
-    try:
-        patch = json.load(sys.stdin)
-    except json.JSONDecodeError as exc:
-        sys.exit(f"Invalid JSON patch: {exc}")
-
+    patches = _read_patches(batch)
     state = load_json(state_path)
-    state.update(patch)
+    validator = _state_validator()
+    for patch in patches:
+        state.update(patch)
+        try:
+            validator.validate(state)
+        except ValidationError as exc:
+            sys.exit(f"Schema validation failed: {exc.message}")
 
-    schema = load_json(SCHEMA_PATH)
-    try:
-        validate(instance=state, schema=schema)
-    except ValidationError as exc:
-        sys.exit(f"Schema validation failed: {exc.message}")
-
-    with state_path.open("w") as f:
-        json.dump(state, f, indent=2)
-        f.write("\n")
+    tmp_path = state_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(state, indent=2) + "\n")
+    os.replace(tmp_path, state_path)
     print(f"State updated for {slug}")
 
 
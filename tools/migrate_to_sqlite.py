@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import json
+import os
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -14,11 +16,9 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-import re
-
-from fastapi import HTTPException, status
 from pydantic import ValidationError
 
+from service import storage
 from service.config import Settings
 from service.models import SessionState
 from service.storage_backends.sqlite_backend import (
@@ -26,8 +26,6 @@ from service.storage_backends.sqlite_backend import (
     SQLiteGenericDocStore,
     SQLiteSnapshotStore,
     SQLiteStateStore,
-    SQLiteTextLogStore,
-    SQLiteTurnStore,
     _json_dumps,
     _fetch_session_id,
     _seed_entropy_from_file,
@@ -43,9 +41,6 @@ DOC_FILES = {
     "auto_save": "auto_save.json",
 }
 
-_SLUG_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
-
-
 @dataclass
 class SessionPaths:
     slug: str
@@ -71,18 +66,23 @@ class ImportResult:
     turn_count: int = 0
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+@dataclass
+class VerifyStores:
+    state: SQLiteStateStore
+    docs: SQLiteGenericDocStore
+    snapshots: SQLiteSnapshotStore
+
+    @classmethod
+    def for_db(cls, db: SQLiteDatabase) -> "VerifyStores":
+        return cls(
+            state=SQLiteStateStore(db),
+            docs=SQLiteGenericDocStore(db),
+            snapshots=SQLiteSnapshotStore(db),
+        )
 
 
-def _validate_state(state: Dict) -> SessionState:
-    try:
-        return SessionState(**state)
-    except ValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"State validation failed: {exc}",
-        )
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 
 def _normalize_db_path(raw: str, base: Path) -> Path:
@@ -98,24 +98,27 @@ def _normalize_db_path(raw: str, base: Path) -> Path:
     return path
 
 
+def _read_json_bytes(path: Path) -> bytes:
+    content = path.read_bytes()
+    if content.startswith(codecs.BOM_UTF8):
+        content = content[len(codecs.BOM_UTF8):]
+    return content
+
+
 def _load_json(path: Path) -> Optional[dict]:
-    if not path.exists():
-        return None
     try:
-        content = path.read_text(encoding="utf-8")
-        if content.startswith("\ufeff"):
-            content = content[1:]
-        return json.loads(content)
+        return json.loads(_read_json_bytes(path))
+    except FileNotFoundError:
+        return None
     except Exception as exc:  # pragma: no cover - defensive logging
         print(f"[WARN] Failed to parse {path}: {exc}", file=sys.stderr)
         return None
 
 
-def _text_lines(path: Path) -> List[str]:
-    if not path.exists():
-        return []
-    with path.open(encoding="utf-8") as handle:
-        return [line.rstrip() for line in handle.readlines() if line.strip()]
+def _iter_text_lines(handle) -> Iterable[str]:
+    for line in handle:
+        if line.strip():
+            yield line.rstrip()
 
 
 def _find_session_paths(source_root: Path, slug: str) -> SessionPaths:
@@ -143,106 +146,112 @@ def _find_session_paths(source_root: Path, slug: str) -> SessionPaths:
     return paths
 
 
-def _iter_turn_files(turns_dir: Path) -> Iterable[Tuple[int, Path]]:
-    if not turns_dir.exists():
+def _json_entries(directory: Path) -> List[os.DirEntry]:
+    # os.scandir hands back cached file types, so filtering costs no extra stat calls.
+    try:
+        with os.scandir(directory) as it:
+            entries = [entry for entry in it if entry.name.endswith(".json") and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    for path in sorted(turns_dir.glob("*.json")):
+    entries.sort(key=lambda entry: entry.name)
+    return entries
+
+
+def _iter_turn_files(turns_dir: Path) -> Iterable[Tuple[int, Path]]:
+    for entry in _json_entries(turns_dir):
         try:
-            turn_number = int(path.stem)
+            turn_number = int(entry.name[: -len(".json")])
         except ValueError:
             continue
-        yield turn_number, path
+        yield turn_number, Path(entry.path)
 
 
 def _iter_save_files(saves_dir: Path) -> Iterable[Path]:
-    if not saves_dir.exists():
-        return []
-    return sorted(p for p in saves_dir.glob("*.json") if p.is_file())
+    return [Path(entry.path) for entry in _json_entries(saves_dir)]
 
 
 def _derive_save_type(save_id: str) -> str:
     return "auto" if save_id.lower().startswith("auto") else "manual"
 
 
-def _import_docs(db: SQLiteDatabase, session_id: int, docs: Dict[str, Path]) -> None:
-    now = _now_iso()
+def _import_docs(db: SQLiteDatabase, session_id: int, docs: Dict[str, Path], now: str) -> None:
+    rows = []
     for doc_key, path in docs.items():
         data = _load_json(path)
         if data is None:
             continue
         payload = data.get("npcs", data) if doc_key == "npc_memory" else data
-        db.conn.execute(
-            """
-            INSERT INTO session_docs (session_id, doc_key, doc_json, updated_at)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(session_id, doc_key) DO UPDATE
-            SET doc_json = excluded.doc_json, updated_at = excluded.updated_at
-            """,
-            (session_id, doc_key, _json_dumps(payload), now),
-        )
+        rows.append((session_id, doc_key, _json_dumps(payload), now))
+    db.conn.executemany(
+        """
+        INSERT INTO session_docs (session_id, doc_key, doc_json, updated_at)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(session_id, doc_key) DO UPDATE
+        SET doc_json = excluded.doc_json, updated_at = excluded.updated_at
+        """,
+        rows,
+    )
 
 
-def _import_text_entries(db: SQLiteDatabase, session_id: int, stream: str, path: Path) -> int:
-    lines = _text_lines(path)
-    if not lines:
+def _import_text_entries(db: SQLiteDatabase, session_id: int, stream: str, path: Path, now: str) -> int:
+    try:
+        handle = path.open(encoding="utf-8")
+    except FileNotFoundError:
         return 0
-    now = _now_iso()
-    for idx, line in enumerate(lines):
-        db.conn.execute(
+    # Rows are generated straight off the file handle so long logs are never held in memory.
+    with handle:
+        cur = db.conn.executemany(
             """
             INSERT INTO text_entries (session_id, stream, entry_id, text, created_at)
             VALUES (?, ?, ?, ?, ?)
             ON CONFLICT(session_id, stream, entry_id) DO UPDATE
             SET text = excluded.text, created_at = excluded.created_at
             """,
-            (session_id, stream, idx, line, now),
+            ((session_id, stream, idx, line, now) for idx, line in enumerate(_iter_text_lines(handle))),
         )
-    return len(lines)
+    return cur.rowcount
 
 
-def _import_turns(db: SQLiteDatabase, session_id: int, turns_dir: Path) -> int:
-    count = 0
-    now = _now_iso()
+def _import_turns(db: SQLiteDatabase, session_id: int, turns_dir: Path, now: str) -> int:
+    rows = []
     for turn_number, path in _iter_turn_files(turns_dir):
         payload = _load_json(path)
         if payload is None:
             continue
-        db.conn.execute(
-            """
-            INSERT INTO turns (session_id, turn_number, turn_record_json, created_at)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(session_id, turn_number) DO UPDATE
-            SET turn_record_json = excluded.turn_record_json, created_at = excluded.created_at
-            """,
-            (session_id, turn_number, _json_dumps(payload), now),
-        )
-        count += 1
-    return count
+        rows.append((session_id, turn_number, _json_dumps(payload), now))
+    db.conn.executemany(
+        """
+        INSERT INTO turns (session_id, turn_number, turn_record_json, created_at)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(session_id, turn_number) DO UPDATE
+        SET turn_record_json = excluded.turn_record_json, created_at = excluded.created_at
+        """,
+        rows,
+    )
+    return len(rows)
 
 
-def _import_saves(db: SQLiteDatabase, session_id: int, saves_dir: Path) -> int:
-    count = 0
-    now = _now_iso()
+def _import_saves(db: SQLiteDatabase, session_id: int, saves_dir: Path, now: str) -> int:
+    rows = []
     for path in _iter_save_files(saves_dir):
         payload = _load_json(path) or {}
         save_id = payload.get("save_id") or path.stem
         save_type = payload.get("save_type") or _derive_save_type(save_id)
         created_at = payload.get("timestamp") or now
-        db.conn.execute(
-            """
-            INSERT INTO snapshots (session_id, save_id, save_type, created_at, snapshot_json)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(session_id, save_id) DO UPDATE
-            SET snapshot_json = excluded.snapshot_json, created_at = excluded.created_at, save_type = excluded.save_type
-            """,
-            (session_id, save_id, save_type, created_at, _json_dumps(payload)),
-        )
-        count += 1
-    return count
+        rows.append((session_id, save_id, save_type, created_at, _json_dumps(payload)))
+    db.conn.executemany(
+        """
+        INSERT INTO snapshots (session_id, save_id, save_type, created_at, snapshot_json)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(session_id, save_id) DO UPDATE
+        SET snapshot_json = excluded.snapshot_json, created_at = excluded.created_at, save_type = excluded.save_type
+        """,
+        rows,
+    )
+    return len(rows)
 
 
-def _import_character(db: SQLiteDatabase, session_id: int, candidates: Sequence[Path], slug: str) -> None:
-    now = _now_iso()
+def _import_character(db: SQLiteDatabase, session_id: int, candidates: Sequence[Path], slug: str, now: str) -> None:
     for path in candidates:
         data = _load_json(path)
         if data is None:
@@ -259,27 +268,23 @@ def _import_character(db: SQLiteDatabase, session_id: int, candidates: Sequence[
         return
 
 
-def _import_previews(db: SQLiteDatabase, session_id: int, previews_dir: Path, state_log_index: int) -> int:
-    if not previews_dir.exists():
-        return 0
-    count = 0
-    for path in sorted(previews_dir.glob("*.json")):
+def _import_previews(
+    db: SQLiteDatabase, session_id: int, previews_dir: Path, state_log_index: int, now: str
+) -> int:
+    rows = []
+    for entry in _json_entries(previews_dir):
+        path = Path(entry.path)
         payload = _load_json(path)
         if not payload:
             continue
         preview_id = payload.get("id") or path.stem
-        created_at = payload.get("created_at") or _now_iso()
+        created_at = payload.get("created_at") or now
         reserved_indices = payload.get("reserved_indices") or []
         base_log_index = payload.get("base_log_index")
         if base_log_index is None:
             base_log_index = reserved_indices[0] - 1 if reserved_indices else state_log_index
         base_turn = payload.get("base_turn") or payload.get("base_turn_number") or 0
-        db.conn.execute(
-            """
-            INSERT OR REPLACE INTO previews (
-                preview_id, session_id, created_at, base_turn_number, base_log_index, reserved_indices_json, payload_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+        rows.append(
             (
                 preview_id,
                 session_id,
@@ -288,10 +293,17 @@ def _import_previews(db: SQLiteDatabase, session_id: int, previews_dir: Path, st
                 int(base_log_index),
                 json.dumps(reserved_indices),
                 _json_dumps(payload),
-            ),
+            )
         )
-        count += 1
-    return count
+    db.conn.executemany(
+        """
+        INSERT OR REPLACE INTO previews (
+            preview_id, session_id, created_at, base_turn_number, base_log_index, reserved_indices_json, payload_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    return len(rows)
 
 
 def import_session(
@@ -301,7 +313,7 @@ def import_session(
     overwrite: bool,
     include_previews: bool,
 ) -> ImportResult:
-    if not _SLUG_PATTERN.match(paths.slug):
+    if not storage.is_valid_slug(paths.slug):
         return ImportResult(slug=paths.slug, imported=False, reason="invalid slug")
     if not paths.state_path.exists():
         return ImportResult(slug=paths.slug, imported=False, reason="missing state.json")
@@ -313,14 +325,11 @@ def import_session(
         with db.conn:
             db.conn.execute("DELETE FROM sessions WHERE slug = ?", (paths.slug,))
 
-    state_data = _load_json(paths.state_path)
-    if state_data is None:
-        return ImportResult(slug=paths.slug, imported=False, reason="state unreadable")
-    validated_state = _validate_state(state_data).model_dump(mode="json")
-
-    transcript_lines = _text_lines(paths.transcript_path)
-    changelog_lines = _text_lines(paths.changelog_path)
-    turn_files = list(_iter_turn_files(paths.turns_dir))
+    # Validate straight from bytes so pydantic parses the state in a single pass.
+    try:
+        validated_state = SessionState.model_validate_json(_read_json_bytes(paths.state_path))
+    except ValidationError as exc:
+        return ImportResult(slug=paths.slug, imported=False, reason=f"state invalid: {exc}")
 
     now = _now_iso()
     with db.conn:
@@ -336,27 +345,29 @@ def import_session(
             """,
             (
                 session_id,
-                _json_dumps(validated_state),
-                int(validated_state["turn"]),
-                int(validated_state["log_index"]),
+                # Same encoder as the backend's own writes, so non-ASCII text is
+                # stored \u-escaped exactly as the service would store it.
+                _json_dumps(validated_state.model_dump(mode="json")),
+                int(validated_state.turn),
+                int(validated_state.log_index),
                 now,
             ),
         )
-        _import_character(db, session_id, paths.character_candidates, paths.slug)
-        _import_docs(db, session_id, paths.docs)
-        transcript_count = _import_text_entries(db, session_id, "transcript", paths.transcript_path)
-        changelog_count = _import_text_entries(db, session_id, "changelog", paths.changelog_path)
-        turn_count = _import_turns(db, session_id, paths.turns_dir)
-        _import_saves(db, session_id, paths.saves_dir)
+        _import_character(db, session_id, paths.character_candidates, paths.slug, now)
+        _import_docs(db, session_id, paths.docs, now)
+        transcript_count = _import_text_entries(db, session_id, "transcript", paths.transcript_path, now)
+        changelog_count = _import_text_entries(db, session_id, "changelog", paths.changelog_path, now)
+        turn_count = _import_turns(db, session_id, paths.turns_dir, now)
+        _import_saves(db, session_id, paths.saves_dir, now)
         if include_previews:
-            _import_previews(db, session_id, paths.previews_dir, validated_state["log_index"])
+            _import_previews(db, session_id, paths.previews_dir, validated_state.log_index, now)
 
     return ImportResult(
         slug=paths.slug,
         imported=True,
-        transcript_count=transcript_count if transcript_lines else 0,
-        changelog_count=changelog_count if changelog_lines else 0,
-        turn_count=turn_count if turn_files else 0,
+        transcript_count=transcript_count,
+        changelog_count=changelog_count,
+        turn_count=turn_count,
     )
 
 
@@ -367,39 +378,40 @@ def verify_session(
     expected_turns: int,
     expected_transcript: int,
     expected_changelog: int,
+    stores: Optional[VerifyStores] = None,
 ) -> Tuple[bool, List[str]]:
+    stores = stores or VerifyStores.for_db(db)
     errors: List[str] = []
     try:
-        _fetch_session_id(db, slug)
+        session_id = _fetch_session_id(db, slug)
     except Exception:
         errors.append("slug missing after import")
         return False, errors
 
-    state = SQLiteStateStore(db).load_state(settings, slug)
+    state = stores.state.load_state(settings, slug)
     if state.get("turn") is None or state.get("log_index") is None:
         errors.append("state missing turn/log_index")
 
-    turn_records = SQLiteTurnStore(db).load_turn_records(settings, slug, limit=max(1, expected_turns))
-    if expected_turns and len(turn_records) != expected_turns:
-        errors.append(f"turn record count mismatch (expected {expected_turns}, got {len(turn_records)})")
-
-    if expected_transcript:
-        transcript, _ = SQLiteTextLogStore(db).load_transcript(
-            settings, slug, tail=expected_transcript, cursor=None
-        )
-        if len(transcript) != expected_transcript:
-            errors.append(f"transcript count mismatch (expected {expected_transcript}, got {len(transcript)})")
-
-    if expected_changelog:
-        changelog, _ = SQLiteTextLogStore(db).load_changelog(
-            settings, slug, tail=expected_changelog, cursor=None
-        )
-        if len(changelog) != expected_changelog:
-            errors.append(f"changelog count mismatch (expected {expected_changelog}, got {len(changelog)})")
+    # Count what was written in one round-trip rather than reloading every row.
+    turn_total, transcript_total, changelog_total = db.conn.execute(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM turns WHERE session_id = :sid),
+            (SELECT COUNT(*) FROM text_entries WHERE session_id = :sid AND stream = 'transcript'),
+            (SELECT COUNT(*) FROM text_entries WHERE session_id = :sid AND stream = 'changelog')
+        """,
+        {"sid": session_id},
+    ).fetchone()
+    if expected_turns and turn_total != expected_turns:
+        errors.append(f"turn record count mismatch (expected {expected_turns}, got {turn_total})")
+    if expected_transcript and transcript_total != expected_transcript:
+        errors.append(f"transcript count mismatch (expected {expected_transcript}, got {transcript_total})")
+    if expected_changelog and changelog_total != expected_changelog:
+        errors.append(f"changelog count mismatch (expected {expected_changelog}, got {changelog_total})")
 
     # Minimal doc existence smoke test when available
-    _ = SQLiteGenericDocStore(db).get_last_discovery_turn(settings, slug)  # noqa: F841
-    _ = SQLiteSnapshotStore(db).list_saves(settings, slug, limit=10)  # noqa: F841
+    _ = stores.docs.get_last_discovery_turn(settings, slug)  # noqa: F841
+    _ = stores.snapshots.list_saves(settings, slug, limit=10)  # noqa: F841
 
     return len(errors) == 0, errors
 
@@ -412,6 +424,7 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser.add_argument("--include-previews", action="store_true", help="Include previews/ directory contents")
     parser.add_argument("--slugs", help="Comma-separated list of slugs to import (defaults to all found)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would happen without writing to SQLite")
+    parser.add_argument("--skip-verify", action="store_true", help="Skip the post-import read-back check")
     return parser.parse_args(argv)
 
 
@@ -433,11 +446,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         print(f"[ERROR] No sessions/ directory under {source_root}", file=sys.stderr)
         return 1
 
-    session_dirs = [p for p in sessions_root.iterdir() if p.is_dir()]
+    with os.scandir(sessions_root) as it:
+        slugs = [entry.name for entry in it if entry.is_dir()]
     if args.slugs:
         selected = {slug.strip() for slug in args.slugs.split(",") if slug.strip()}
-        session_dirs = [p for p in session_dirs if p.name in selected]
-    slugs = sorted(p.name for p in session_dirs)
+        slugs = [slug for slug in slugs if slug in selected]
+    slugs.sort()
     if not slugs:
         print("[WARN] No sessions found to import")
         return 0
@@ -447,8 +461,23 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 0
 
     db = SQLiteDatabase(db_path)
+    # --db usually points at a store that already holds other sessions, and a
+    # re-run cannot repair a corrupted file, so keep the default rollback
+    # journal. synchronous = NORMAL skips some fsyncs but still syncs at the
+    # critical points, so an interrupted import cannot corrupt the store. A
+    # larger page cache and memory-mapped reads keep index lookups for the
+    # ON CONFLICT upserts off the read() path. None of these persist in the file.
+    db.conn.executescript(
+        """
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -65536;
+        PRAGMA mmap_size = 268435456;
+        """
+    )
     entropy_seeded = _seed_entropy_from_file(db, settings)
     print(f"[INFO] Entropy seeded up to index {entropy_seeded}")
+    stores = VerifyStores.for_db(db)
 
     imported = 0
     skipped = 0
@@ -465,14 +494,18 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             print(f"[FAIL] {slug}: {result.reason or 'unknown error'}")
             continue
 
-        ok, errors = verify_session(
-            db,
-            settings,
-            slug,
-            expected_turns=result.turn_count,
-            expected_transcript=result.transcript_count,
-            expected_changelog=result.changelog_count,
-        )
+        if args.skip_verify:
+            ok, errors = True, []
+        else:
+            ok, errors = verify_session(
+                db,
+                settings,
+                slug,
+                expected_turns=result.turn_count,
+                expected_transcript=result.transcript_count,
+                expected_changelog=result.changelog_count,
+                stores=stores,
+            )
         status = "OK" if ok else "VERIFY-FAIL"
         if ok:
             imported += 1
@@ -3,7 +3,7 @@ import json
 from pathlib import Path
 from datetime import datetime
 
-from tools.explore import next_entropy, roll_from_entry
+from tools.explore import next_entropy, read_json, roll_from_entry, write_json
 
 
 def main():
@@ -17,8 +17,8 @@ def main():
     transcript_path = session_dir / "transcript.md"
     changelog_path = session_dir / "changelog.md"
 
-    state = json.load(open(state_path, "r", encoding="utf-8"))
-    monster = json.load(open(args.monster, "r", encoding="utf-8"))
+    state = read_json(state_path)
+    monster = read_json(args.monster)
 
     entry = next_entropy(state.get("log_index", 0))
     initiative_player = roll_from_entry("1d20", entry)
@@ -63,7 +63,7 @@ def main():
     encounters_dir = session_dir / "encounters"
     encounters_dir.mkdir(exist_ok=True)
     encounter_path = encounters_dir / f"{encounter_log['stamp'].replace(':','-')}\.json"
-    json.dump(encounter_log, open(encounter_path, "w", encoding="utf-8"), indent=2)
+    write_json(encounter_path, encounter_log)
 
     with open(transcript_path, "a", encoding="utf-8") as tlog:
         tlog.write(
@@ -73,7 +73,7 @@ def main():
     with open(changelog_path, "a", encoding="utf-8") as clog:
         clog.write(json.dumps({"type": "encounter", "rolls": encounter_log["rolls"]}) + "\n")
 
-    json.dump(state, open(state_path, "w", encoding="utf-8"), indent=2)
+    write_json(state_path, state)
 
 
 if __name__ == "__main__":
@@ -20,7 +20,7 @@ REQUIRED_MONSTER_FIELDS = {
 
 def _load_json(path: Path) -> dict:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_bytes())
     except json.JSONDecodeError as exc:
         raise ValueError(f"{path}: invalid JSON ({exc})") from exc
 
@@ -37,7 +37,7 @@ def _validate_monsters(monsters_dir: Path) -> list[str]:
         except ValueError as exc:
             errors.append(str(exc))
             continue
-        missing = REQUIRED_MONSTER_FIELDS - payload.keys()
+        missing = REQUIRED_MONSTER_FIELDS.difference(payload)
         if missing:
             errors.append(f"{path}: missing fields {sorted(missing)}")
         if not isinstance(payload.get("actions"), list) or not payload["actions"]:
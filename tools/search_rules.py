@@ -1,11 +1,38 @@
 import argparse
+import heapq
 import json
 from collections import Counter
 from pathlib import Path
 
-
-def tokenize(text):
-    return [t.strip(".,;:!?").lower() for t in text.split() if t.strip()]
+# Queries must be tokenized exactly like the index was built.
+try:
+    from tools.index_rules import tokenize
+except ImportError:  # run as a script, where tools/ itself is sys.path[0]
+    from index_rules import tokenize
+
+
+def _iter_docs(out_dir):
+    ndjson_path = out_dir / "docs.ndjson"
+    if not ndjson_path.exists():
+        # Indexes built before the NDJSON layout hold every document in docs.json.
+        yield from json.loads((out_dir / "docs.json").read_bytes())
+        return
+    with open(ndjson_path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _load_postings(out_dir):
+    postings_path = out_dir / "postings.json"
+    if postings_path.exists():
+        return json.loads(postings_path.read_bytes())
+    # Older indexes carry no postings; derive them from the per-document tokens.
+    postings = {}
+    for doc_id, doc in enumerate(_iter_docs(out_dir)):
+        for token, tf in Counter(doc["tokens"]).items():
+            postings.setdefault(token, []).append((doc_id, tf))
+    return postings
 
 
 def main():
@@ -15,17 +42,16 @@ def main():
     query_tokens = tokenize(" ".join(args.query))
 
     out_dir = Path("rules_index")
-    docs = json.load(open(out_dir / "docs.json", "r", encoding="utf-8"))
-    meta = json.load(open(out_dir / "docmeta.json", "r", encoding="utf-8"))
+    meta = json.loads((out_dir / "docmeta.json").read_bytes())
 
-    scores = []
-    q_count = Counter(query_tokens)
-    for doc in docs:
-        doc_count = Counter(doc["tokens"])
-        score = sum(doc_count.get(tok, 0) * q_count.get(tok, 1) for tok in query_tokens)
-        scores.append(score)
+    postings = _load_postings(out_dir)
+    scores = [0] * len(meta)
+    # Every occurrence of a query token adds tf * qf, i.e. tf * qf**2 per distinct token.
+    for tok, qf in Counter(query_tokens).items():
+        for doc_id, tf in postings.get(tok, ()):
+            scores[doc_id] += tf * qf * qf
 
-    top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:5]
+    top_indices = heapq.nlargest(5, range(len(scores)), key=scores.__getitem__)
     for idx in top_indices:
         print(f"{meta[idx]['file']}: score={scores[idx]} lines=1-{meta[idx]['lines']}")
 
@@ -1,16 +1,20 @@
 import json
+import os
+import re
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 import subprocess
 
 try:
-    import jsonschema
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
 except ImportError:  # pragma: no cover
-    class _Dummy:
-        @staticmethod
-        def validate(instance, schema):
-            return True
+    validator_for = None
 
-    jsonschema = _Dummy()
+ROOT = Path(__file__).resolve().parents[1]
+_QR = itemgetter("q", "r")
 
 SCHEMAS = [
   "state.schema.json",
@@ -23,71 +27,175 @@ SCHEMAS = [
   "log_entry.schema.json",
 ]
 
+# Files each check needs, keyed by the relative POSIX path they must match.
+# Schema names map straight to the files validated against that schema.
+TREE_PATTERNS = [
+  ("state.schema.json", re.compile(r"sessions/[^/]+/state\.json")),
+  ("character.schema.json", re.compile(r"data/characters/[^/]+\.json")),
+  ("table.schema.json", re.compile(r"tables/.+\.json")),
+  ("hexmap.schema.json", re.compile(r"worlds/.+\.json")),
+  ("quest.schema.json", re.compile(r"quests/.+\.json")),
+  ("encounter.schema.json", re.compile(r"sessions/[^/]+/encounters/[^/]+\.json")),
+  ("loot.schema.json", re.compile(r"sessions/[^/]+/loot/[^/]+\.json")),
+  ("hexmap.json", re.compile(r"worlds/[^/]+/hexmap\.json")),
+  ("log_entry.schema.json", re.compile(r"sessions/[^/]+/changelog\.md")),
+]
+SESSION_REQUIRED_FILES = frozenset({"transcript.md", "changelog.md", "turn.md"})
+CACHE_NAME = ".validate_cache.json"
+TREE_ROOTS = ["data", "tables", "worlds", "quests", "sessions"]
+# Directories index_tree() never descends into: hidden dirs and quest templates.
+PRUNED_DIR_PATTERN = re.compile(r"(?:.+/)?\.[^/]*|quests/(?:.+/)?templates")
+
+
+def load_json(path):
+    return json.loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=None)
+def _schema_validator(schema_path):
+    # Compile each schema once; changelogs are validated line by line.
+    if validator_for is None:
+        return None
+    schema = load_json(schema_path)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def _validate(data, validator):
+    if validator is None:
+        return
+    error = best_match(validator.iter_errors(data))
+    if error is not None:
+        raise error
+
+
+def _session_dirs(root):
+    # One scandir pass with cached file types instead of a glob per session file.
+    try:
+        with os.scandir(root / "sessions") as it:
+            return sorted(Path(entry.path) for entry in it if entry.is_dir())
+    except FileNotFoundError:
+        return []
+
+
+def index_tree(root):
+    """Walk the validated directories once and bucket files by TREE_PATTERNS key."""
+    buckets = defaultdict(list)
+    pending = [root / name for name in TREE_ROOTS]
+    while pending:
+        directory = pending.pop()
+        try:
+            it = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with it:
+            for entry in it:
+                rel = Path(entry.path).relative_to(root).as_posix()
+                if entry.is_dir():
+                    if not PRUNED_DIR_PATTERN.fullmatch(rel):
+                        pending.append(Path(entry.path))
+                    continue
+                for key, pattern in TREE_PATTERNS:
+                    if pattern.fullmatch(rel):
+                        buckets[key].append(Path(entry.path))
+    for paths in buckets.values():
+        paths.sort()
+    return buckets
+
+
+def _check_required(entries, required, kind):
+    for entry in entries:
+        # difference() iterates the dict's keys directly; no per-entry set is built.
+        missing = required.difference(entry)
+        if missing:
+            raise ValueError(f"{kind} table entry missing fields: {missing}")
 
-def validate_file(path, schema_path):
-    data = json.load(open(path, "r", encoding="utf-8"))
-    schema = json.load(open(schema_path, "r", encoding="utf-8"))
-    jsonschema.validate(data, schema)
 
+class ValidationCache:
+    """Files that passed schema validation, keyed by (mtime_ns, size, schema mtime_ns)."""
 
-def main():
-    root = Path(__file__).resolve().parents[1]
-    creation_tables = root / "character_creation" / "tables"
-    for schema_name in SCHEMAS:
-        schema_path = root / "schemas" / schema_name
-        if schema_name == "state.schema.json":
-            for state_file in root.glob("sessions/*/state.json"):
-                validate_file(state_file, schema_path)
-        elif schema_name == "character.schema.json":
-            for character_file in root.glob("data/characters/*.json"):
-                validate_file(character_file, schema_path)
-        elif schema_name == "table.schema.json":
-            for table_file in root.glob("tables/**/*.json"):
-                validate_file(table_file, schema_path)
-        elif schema_name == "hexmap.schema.json":
-            for hx in root.glob("worlds/**/*.json"):
-                validate_file(hx, schema_path)
-        elif schema_name == "quest.schema.json":
-            for q in root.glob("quests/**/*.json"):
-                if "templates" in q.parts:
-                    continue
-                try:
-                    validate_file(q, schema_path)
-                except FileNotFoundError:
-                    continue
-        elif schema_name == "encounter.schema.json":
-            for enc in root.glob("sessions/*/encounters/*.json"):
-                validate_file(enc, schema_path)
-        elif schema_name == "loot.schema.json":
-            for loot in root.glob("sessions/*/loot/*.json"):
-                validate_file(loot, schema_path)
-        elif schema_name == "log_entry.schema.json":
-            for changelog in root.glob("sessions/*/changelog.md"):
-                for line in changelog.read_text(encoding="utf-8").splitlines():
-                    if not line.strip():
-                        continue
-                    validate_file_line(line, schema_path)
+    def __init__(self, path, entries):
+        self.path = path
+        self.entries = entries
+        self.fresh = {}
 
-    # Background/class/race/inventory completeness
-    required_race_fields = {"name", "ability_modifiers", "size", "speed", "languages"}
-    for race in json.load(open(creation_tables / "races.json", "r", encoding="utf-8")):
-        missing = required_race_fields - set(race.keys())
-        if missing:
-            raise ValueError(f"Race table entry missing fields: {missing}")
+    @classmethod
+    def load(cls, path):
+        try:
+            entries = load_json(path)
+        except (FileNotFoundError, ValueError):
+            entries = {}
+        return cls(path, entries if isinstance(entries, dict) else {})
 
-    required_class_fields = {"name", "hit_die", "primary_ability", "saving_throws", "features"}
-    for cls in json.load(open(creation_tables / "classes.json", "r", encoding="utf-8")):
-        missing = required_class_fields - set(cls.keys())
-        if missing:
-            raise ValueError(f"Class table entry missing fields: {missing}")
+    def run(self, check, path, validator, schema_mtime):
+        if validator is None:
+            # Without jsonschema nothing is validated, so nothing may be recorded as passing.
+            check(path, validator)
+            return
+        stat = os.stat(path)
+        key = [stat.st_mtime_ns, stat.st_size, schema_mtime]
+        name = str(path)
+        if self.entries.get(name) != key:
+            check(path, validator)
+        self.fresh[name] = key
+
+    def save(self):
+        # Only files seen this run are kept, so deleted files drop out of the cache.
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.fresh, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
 
-    required_background_fields = {"name", "skill_proficiencies", "tool_proficiencies", "feature", "equipment"}
-    for bg in json.load(open(creation_tables / "backgrounds.json", "r", encoding="utf-8")):
-        missing = required_background_fields - set(bg.keys())
-        if missing:
-            raise ValueError(f"Background table entry missing fields: {missing}")
 
-    inventories = json.load(open(creation_tables / "inventories.json", "r", encoding="utf-8"))
+def validate_file(path, validator):
+    _validate(load_json(path), validator)
+
+
+def validate_changelog(path, validator):
+    # Stream raw lines; json.loads accepts bytes and ignores the trailing newline.
+    with open(path, "rb") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            validate_file_line(line, validator)
+
+
+# Schemas whose files are not a single JSON document.
+SCHEMA_CHECKS = {"log_entry.schema.json": validate_changelog}
+
+
+def main():
+    creation_tables = ROOT / "character_creation" / "tables"
+    session_dirs = _session_dirs(ROOT)
+    tree = index_tree(ROOT)
+    cache = ValidationCache.load(ROOT / CACHE_NAME)
+    for schema_name in SCHEMAS:
+        schema_path = ROOT / "schemas" / schema_name
+        validator = _schema_validator(str(schema_path))
+        schema_mtime = schema_path.stat().st_mtime_ns
+        check = SCHEMA_CHECKS.get(schema_name, validate_file)
+        for path in tree[schema_name]:
+            cache.run(check, path, validator, schema_mtime)
+    cache.save()
+
+    # Background/class/race/inventory completeness
+    _check_required(
+        load_json(creation_tables / "races.json"),
+        {"name", "ability_modifiers", "size", "speed", "languages"},
+        "Race",
+    )
+    _check_required(
+        load_json(creation_tables / "classes.json"),
+        {"name", "hit_die", "primary_ability", "saving_throws", "features"},
+        "Class",
+    )
+    _check_required(
+        load_json(creation_tables / "backgrounds.json"),
+        {"name", "skill_proficiencies", "tool_proficiencies", "feature", "equipment"},
+        "Background",
+    )
+
+    inventories = load_json(creation_tables / "inventories.json")
     for class_kit in inventories.get("class_kits", []):
         if not class_kit.get("class") or not class_kit.get("items"):
             raise ValueError("Inventory class kit missing class or items")
@@ -95,41 +203,40 @@ def main():
         if not bg_kit.get("background") or not bg_kit.get("items"):
             raise ValueError("Inventory background kit missing background or items")
 
-    # Session completeness
-    for session_dir in root.glob("sessions/*"):
-        state_path = session_dir / "state.json"
-        if not state_path.exists():
+    # Session completeness: one listing per session dir instead of a stat per file.
+    character_slugs = {path.stem for path in tree["character.schema.json"]}
+    for session_dir in session_dirs:
+        with os.scandir(session_dir) as it:
+            entries = {entry.name for entry in it}
+        if "state.json" not in entries:
             continue
         slug = session_dir.name
-        character_path = root / "data" / "characters" / f"{slug}.json"
-        transcript_path = session_dir / "transcript.md"
-        changelog_path = session_dir / "changelog.md"
-        turn_path = session_dir / "turn.md"
-        if not all(p.exists() for p in [character_path, transcript_path, changelog_path, turn_path]):
+        if slug not in character_slugs or not SESSION_REQUIRED_FILES <= entries:
             raise ValueError(f"Session {slug} missing required files")
-        if (session_dir / "creation_progress.json").exists():
+        if "creation_progress.json" in entries:
             raise ValueError(f"creation_progress.json should be removed for finalized session {slug}")
 
     # Hex neighbor check
-
-    # Hex neighbor check
-    for hx_path in root.glob("worlds/*/hexmap.json"):
-        data = json.load(open(hx_path, "r", encoding="utf-8"))
-        coords = {(h["q"], h["r"]) for h in data.get("hexes", [])}
-        for h in data.get("hexes", []):
-            for n in h.get("neighbors", []):
-                if (n["q"], n["r"]) not in coords:
+    for hx_path in tree["hexmap.json"]:
+        hexes = load_json(hx_path).get("hexes", ())
+        coords = frozenset(map(_QR, hexes))
+        for h in hexes:
+            for n in h.get("neighbors", ()):
+                if _QR(n) not in coords:
                     raise ValueError(f"Invalid neighbor {n} in {hx_path}")
 
     # Audit entropy uniqueness and changelog determinism
-    for changelog in root.glob("sessions/*/changelog.md"):
-        subprocess.run(["python", str(root / "dice" / "verify_dice.py"), "--audit", str(changelog)], check=False)
+    changelogs = tree["log_entry.schema.json"]
+    if changelogs:
+        # One interpreter audits every changelog instead of one per session.
+        subprocess.run(
+            ["python", str(ROOT / "dice" / "verify_dice.py"), "--audit", *map(str, changelogs)],
+            check=False,
+        )
 
 
-def validate_file_line(line: str, schema_path: Path):
-    data = json.loads(line)
-    schema = json.load(open(schema_path, "r", encoding="utf-8"))
-    jsonschema.validate(data, schema)
+def validate_file_line(line, validator):
+    _validate(json.loads(line), validator)
 
 
 if __name__ == "__main__":